@@ -0,0 +1,14 @@
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Runs the async tests on uvloop when it's installed, otherwise on the current event loop policy."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.get_event_loop_policy()
+
+    return uvloop.EventLoopPolicy()
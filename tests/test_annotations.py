@@ -0,0 +1,117 @@
+import sys
+import types
+from unittest.mock import patch
+
+import pytest
+
+from tramp._annotations import ForwardRef, ForwardReferencableNamespace, Format, get_annotations
+
+
+class Annotated:
+    x: "int"
+    y: "list[Defined]"
+    z: "Undefined"
+
+
+class Defined:
+    pass
+
+
+def test_get_annotations():
+    annotations = get_annotations(Annotated, Format.FORWARDREF)
+    assert annotations["x"] is int
+    assert annotations["y"] == list[Defined]
+    assert isinstance(annotations["z"], ForwardRef)
+
+
+def test_forward_ref_evaluate():
+    annotations = get_annotations(Annotated, Format.FORWARDREF)
+    globals()["Undefined"] = Defined
+    try:
+        assert annotations["z"].evaluate() is Defined
+    finally:
+        del globals()["Undefined"]
+
+
+def test_forward_ref_namespace_contains():
+    namespace = ForwardReferencableNamespace(__name__)
+    assert "Defined" in namespace
+    assert "int" in namespace
+    assert "Undefined" not in namespace
+
+
+def test_get_annotations_cached_after_resolution():
+    class Resolved:
+        x: "int"
+
+    annotations = get_annotations(Resolved, Format.FORWARDREF)
+    annotations["x"] = str
+    assert get_annotations(Resolved, Format.FORWARDREF) == {"x": int}
+
+
+def test_get_annotations_not_cached_with_forward_refs():
+    assert isinstance(get_annotations(Annotated, Format.FORWARDREF)["z"], ForwardRef)
+    globals()["Undefined"] = Defined
+    try:
+        assert get_annotations(Annotated, Format.FORWARDREF)["z"] is Defined
+    finally:
+        del globals()["Undefined"]
+
+
+def test_get_annotations_with_string_annotations():
+    module = types.ModuleType("test_module")
+    module.SomeClass = Defined
+    with patch.dict(sys.modules, {"test_module": module}):
+        Annotations = type(
+            "Annotations",
+            (),
+            {"__module__": "test_module", "__annotations__": {"x": "SomeClass", "y": "int", "z": str}},
+        )
+        assert get_annotations(Annotations, Format.FORWARDREF) == {"x": Defined, "y": int, "z": str}
+
+
+def test_module_globals_shadow_builtins():
+    module = types.ModuleType("test_module")
+    module.int = str
+    with patch.dict(sys.modules, {"test_module": module}):
+        namespace = ForwardReferencableNamespace("test_module")
+        assert namespace["int"] is str
+        assert namespace["float"] is float
+
+
+def test_format_enum():
+    assert (Format.VALUE, Format.FORWARDREF, Format.STRING) == (1, 2, 3)
+    assert Format(2) is Format.FORWARDREF
+    assert Format.FORWARDREF.name == "FORWARDREF"
+    assert list(Format) == [Format.VALUE, Format.FORWARDREF, Format.STRING]
+
+
+def test_unsupported_format():
+    with pytest.raises(ValueError):
+        get_annotations(Annotated, Format.VALUE)
+
+
+def test_get_annotations_unregistered_module():
+    Unregistered = type("Unregistered", (), {"__module__": "not_a_module", "__annotations__": {"x": int}})
+    assert get_annotations(Unregistered, Format.FORWARDREF) == {"x": int}
+
+    namespace = {}
+    exec("def f(x: int) -> str: ...", namespace)
+    assert get_annotations(namespace["f"], Format.FORWARDREF) == {"x": int, "return": str}
+
+
+def test_get_annotations_cache_sees_changed_annotations():
+    class Changed:
+        x: "int"
+
+    assert get_annotations(Changed, Format.FORWARDREF) == {"x": int}
+    Changed.__annotations__["x"] = "str"
+    assert get_annotations(Changed, Format.FORWARDREF) == {"x": str}
+    Changed.__annotations__["y"] = float
+    assert get_annotations(Changed, Format.FORWARDREF) == {"x": str, "y": float}
+
+    def f(x: int): ...
+
+    assert get_annotations(f, Format.FORWARDREF) == {"x": int}
+    f.__annotations__ = {"x": "str"}
+    assert get_annotations(f, Format.FORWARDREF) == {"x": str}
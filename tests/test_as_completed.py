@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from tramp.as_completed import AsCompleted
+
+
+async def slow_task(value):
+    await asyncio.sleep(0.02)
+    return value
+
+
+async def fast_task(value):
+    return value
+
+
+async def failing_task():
+    raise RuntimeError("Task failed")
+
+
+@pytest.mark.asyncio
+async def test_async_iteration():
+    tasks = [asyncio.create_task(slow_task(1)), asyncio.create_task(fast_task(2))]
+    result = [r async for r in AsCompleted(*tasks)]
+    assert result == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_sync_iteration():
+    tasks = [asyncio.create_task(slow_task(1)), asyncio.create_task(fast_task(2))]
+    result = [await future for future in AsCompleted(*tasks)]
+    assert result == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_no_tasks():
+    assert [r async for r in AsCompleted()] == []
+
+
+@pytest.mark.asyncio
+async def test_already_done_tasks():
+    tasks = [asyncio.create_task(fast_task(1)), asyncio.create_task(fast_task(2))]
+    await asyncio.gather(*tasks)
+    result = [r async for r in AsCompleted(*tasks)]
+    assert sorted(result) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_task_exception():
+    with pytest.raises(RuntimeError):
+        async for _ in AsCompleted(asyncio.create_task(failing_task())):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_coroutines():
+    result = [r async for r in AsCompleted(slow_task(1), fast_task(2))]
+    assert result == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_eager_coroutines():
+    result = [r async for r in AsCompleted(slow_task(1), fast_task(2), eager=True)]
+    assert result == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_tasks():
+    task = asyncio.create_task(slow_task(5))
+    assert [r async for r in AsCompleted(task, task)] == [5]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_consumers():
+    as_completed = AsCompleted(asyncio.create_task(slow_task(1)))
+
+    async def consume():
+        return [r async for r in as_completed]
+
+    results = await asyncio.wait_for(asyncio.gather(consume(), consume()), 1)
+    assert sorted(results) == [[], [1]]
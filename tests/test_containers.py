@@ -0,0 +1,51 @@
+import copy
+import pickle
+
+import pytest
+
+from tramp.containers import Container
+
+
+def test_empty_container():
+    container = Container()
+    assert container.never_set
+    assert container.value_or(0) == 0
+    with pytest.raises(ValueError):
+        container.value
+
+
+def test_container_none_default():
+    container = Container(None)
+    assert not container.never_set
+    assert container.value is None
+    assert container.value_or(0) is None
+
+
+def test_container_default_keyword():
+    container = Container[int](default=1)
+    assert container.value == 1
+
+
+def test_container_set():
+    container = Container()
+    container.set(1)
+    assert not container.never_set
+    assert container.value == 1
+    assert container.value_or(0) == 1
+
+
+def test_container_is_slot_only():
+    assert not hasattr(Container(), "__dict__")
+
+
+def test_copy_empty_container():
+    for container in (copy.copy(Container()), copy.deepcopy(Container())):
+        assert container.never_set
+        assert container.value_or(0) == 0
+
+
+def test_pickle_container():
+    empty = pickle.loads(pickle.dumps(Container()))
+    assert empty.never_set
+    assert empty.value_or(0) == 0
+    assert pickle.loads(pickle.dumps(Container(1))).value == 1
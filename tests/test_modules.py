@@ -0,0 +1,9 @@
+import sys
+
+from tramp.modules import get_module_namespace
+
+
+def test_get_module_namespace():
+    namespace = get_module_namespace("sys")
+    assert namespace is vars(sys)
+    assert namespace["modules"] is sys.modules
@@ -0,0 +1,60 @@
+import pytest
+
+from tramp.optionals import (
+    Nothing,
+    Optional,
+    OptionalHasNoValueException,
+    OptionalTypeCannotBeInstantiated,
+    Some,
+)
+
+
+def test_nothing_singleton():
+    assert Nothing() is Nothing()
+    assert Optional.Nothing() is Nothing()
+    assert Optional.wrap(None) is Nothing()
+
+
+def test_wrap_value():
+    result = Optional.wrap(0)
+    assert isinstance(result, Some)
+    assert result.value == 0
+
+
+def test_some():
+    assert Some(1).value == 1
+    assert Some(1).value_or(0) == 1
+    assert Some(1)
+
+
+def test_nothing():
+    assert Nothing().value_or(0) == 0
+    assert not Nothing()
+    with pytest.raises(OptionalHasNoValueException):
+        Nothing().value
+
+
+def test_base_optional_cannot_be_instantiated():
+    with pytest.raises(OptionalTypeCannotBeInstantiated):
+        Optional()
+
+
+def test_match():
+    match Optional.Some(1):
+        case Optional.Some(x):
+            assert x == 1
+
+        case _:
+            pytest.fail("Some did not match")
+
+    match Optional.wrap(None):
+        case Optional.Some(_):
+            pytest.fail("Nothing matched Some")
+
+        case Optional.Nothing():
+            pass
+
+
+def test_optionals_have_no_instance_dict():
+    assert not hasattr(Some(1), "__dict__")
+    assert not hasattr(Nothing(), "__dict__")
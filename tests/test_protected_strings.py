@@ -1,8 +1,6 @@
-from mailbox import FormatError
-
 import pytest
 
-from tramp.protected_strings import ProtectedString
+from tramp.protected_strings import FormatError, ProtectedString, ProtectedStringBuilder
 
 
 def test_repr():
@@ -63,3 +61,61 @@ def test_valid_format_spec():
 
     with pytest.raises(FormatError):
         f"{ProtectedString('value'):***$}"
+
+
+def test_format_allowed_names_with_whitespace():
+    builder = ProtectedString('FOO', 'foo') + ProtectedString('BAR', 'bar') + 'other'
+    assert f"{builder:$ foo , bar }" == "FOOBARother"
+
+
+def test_invalid_allowed_name():
+    with pytest.raises(FormatError):
+        f"{ProtectedString('value'):$123invalid}"
+
+
+def test_join_allowed_callable():
+    parts = [ProtectedString('FOO', 'foo'), ProtectedString('BAR', 'bar'), 'other']
+    assert ProtectedString.join(parts, allowed=lambda s: s.name == 'bar') == "<Redacted Foo>BARother"
+
+
+def test_format_allowed_unicode_name():
+    assert f"{ProtectedString('value', 'naïve'):$naïve}" == "value"
+
+
+def test_builder_immutability():
+    builder = ProtectedString('value') + 'other'
+    combined = builder + '!!!'
+    assert builder.render() == "<Redacted>other"
+    assert combined.render() == "<Redacted>other!!!"
+    assert (builder + combined).render() == "<Redacted>other<Redacted>other!!!"
+
+
+def test_builder_iadd_mutating():
+    builder = ProtectedString('value') + 'other'
+    same = builder
+    builder += '!!!'
+    builder += ProtectedString('value') + 'more'
+    assert builder is same
+    assert builder.render() == "<Redacted>other!!!<Redacted>more"
+
+
+def test_render_allowed_iterables():
+    builder = ProtectedString('FOO', 'foo') + ProtectedString('BAR', 'bar') + 'other'
+    assert builder.render(allowed=('foo', 'bar')) == "FOOBARother"
+    assert builder.render(allowed=(name for name in ['bar'])) == "<Redacted Foo>BARother"
+    assert builder.render(allowed={'foo': True}) == "FOO<Redacted Bar>other"
+
+
+def test_render_plain_strings():
+    builder = ProtectedStringBuilder("foo", "bar")
+    assert builder.render() == "foobar"
+    builder += "baz"
+    assert builder.render() == "foobarbaz"
+    builder.add("secret", "password")
+    assert builder.render() == "foobarbaz<Redacted Password>"
+
+
+def test_render_strings_mutated_directly():
+    builder = ProtectedStringBuilder("foo")
+    builder.strings.append(ProtectedString("secret"))
+    assert builder.render() == "foo<Redacted>"
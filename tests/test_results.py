@@ -0,0 +1,68 @@
+import pytest
+
+from tramp.results import (
+    Result,
+    ResultWasAnErrorException,
+    ResultWasNeverSetException,
+)
+
+
+def test_try_success():
+    result = Result.try_(int, "1")
+    assert isinstance(result, Result.Value)
+    assert result.value == 1
+    assert result.error is None
+
+
+def test_try_failure():
+    result = Result.try_(int, "one")
+    assert isinstance(result, Result.Error)
+    assert isinstance(result.error, ValueError)
+    assert result.value_or(0) == 0
+    with pytest.raises(ResultWasAnErrorException):
+        result.value
+
+
+def test_build_value():
+    with Result.build() as result:
+        result.value = 1
+
+    assert type(result) is Result.Value
+    assert result.value == 1
+    assert result
+
+
+def test_build_none_value():
+    with Result.build() as result:
+        result.value = None
+
+    assert type(result) is Result.Value
+    assert result.value is None
+
+
+def test_build_never_set():
+    with Result.build() as result:
+        pass
+
+    assert type(result) is Result.Error
+    assert isinstance(result.error, ResultWasNeverSetException)
+    assert not result
+
+
+def test_build_raises():
+    error = RuntimeError("Error")
+    with Result.build() as result:
+        raise error
+
+    assert type(result) is Result.Error
+    assert result.error is error
+    with pytest.raises(ResultWasAnErrorException):
+        result.value
+
+
+def test_results_have_no_instance_dict():
+    with Result.build() as result:
+        result.value = 1
+
+    for obj in (result, Result.Value(1), Result.Error(RuntimeError())):
+        assert not hasattr(obj, "__dict__")
@@ -0,0 +1,45 @@
+import copy
+import pickle
+
+from tramp.sentinels import sentinel
+
+NotSet = sentinel("NotSet")
+
+
+def test_sentinel_identity():
+    assert NotSet() is NotSet()
+    assert NotSet() is not sentinel("NotSet")()
+
+
+def test_sentinel_copy():
+    assert copy.copy(NotSet()) is NotSet()
+    assert copy.deepcopy(NotSet()) is NotSet()
+    assert copy.deepcopy({"x": NotSet()})["x"] is NotSet()
+
+
+def test_sentinel_subclass_gets_own_instance():
+    parent = NotSet()
+
+    class Child(NotSet):
+        pass
+
+    assert Child() is Child()
+    assert Child() is not parent
+    assert NotSet() is parent
+
+
+def test_sentinel_is_slot_only():
+    assert not hasattr(NotSet(), "__dict__")
+    assert NotSet.__slots__ == ()
+
+
+def test_sentinel_equality_and_hash():
+    Other = sentinel("Other")
+    assert NotSet() == NotSet()
+    assert NotSet() != Other()
+    assert hash(NotSet()) == object.__hash__(NotSet())
+    assert {NotSet(): 1, Other(): 2}[NotSet()] == 1
+
+
+def test_sentinel_pickle():
+    assert pickle.loads(pickle.dumps(NotSet())) is NotSet()
@@ -1,5 +1,9 @@
+import builtins
 import sys
 from typing import Any, Callable, Type
+from weakref import WeakKeyDictionary
+
+from tramp.sentinels import sentinel
 
 from enum import IntEnum
 
@@ -10,24 +14,38 @@ class Format(IntEnum):
     STRING = 3
 
 
+_NOT_FOUND = sentinel("_NOT_FOUND")()
+_builtins_namespace = vars(builtins)
+# Maps each object to a snapshot of its raw annotations and the annotations resolved from them
+_resolved_annotations_cache: "WeakKeyDictionary[Type | Callable, tuple[dict[str, Any], dict[str, Any]]]" = (
+    WeakKeyDictionary()
+)
+
+
 class ForwardReferencableNamespace:
     def __init__(self, module):
         self.module = module
+        # Objects created outside a registered module (e.g. through exec) can still have non-string annotations
+        self._namespace = vars(sys.modules[module]) if module in sys.modules else {}
+        self.created_forward_refs = False
 
     def __getitem__(self, item):
-        if hasattr(sys.modules[self.module], item):
-            return getattr(sys.modules[self.module], item)
-        elif hasattr(__builtins__, item):
-            return getattr(__builtins__, item)
-        else:
-            return ForwardRefMeta(
-                f"ForwardReferenceTo_{item}",
-                (ForwardRef,),
-                {"name": item, "namespace": self}
-            )
+        # Module globals take precedence over builtins, matching normal name resolution
+        if (obj := self._namespace.get(item, _NOT_FOUND)) is not _NOT_FOUND:
+            return obj
+
+        if (obj := _builtins_namespace.get(item, _NOT_FOUND)) is not _NOT_FOUND:
+            return obj
+
+        self.created_forward_refs = True
+        return ForwardRefMeta(
+            f"ForwardReferenceTo_{item}",
+            (ForwardRef,),
+            {"name": item, "namespace": self}
+        )
 
     def __contains__(self, item):
-        return hasattr(sys.modules[self.module], item) or hasattr(__builtins__, item)
+        return item in self._namespace or item in _builtins_namespace
 
 
 class ForwardRefMeta(type):
@@ -79,11 +97,30 @@ class ForwardRef(metaclass=ForwardRefMeta):
 
 
 def get_annotations(obj: Type | Callable, annotation_format: Format) -> dict[str, Any]:
-    if annotation_format is not Format.FORWARDREF:
+    if annotation_format != Format.FORWARDREF:
         raise ValueError(f"Tramp only supports {Format.FORWARDREF}.")
 
+    raw_annotations = obj.__annotations__
+    try:
+        snapshot, resolved = _resolved_annotations_cache[obj]
+    except (KeyError, TypeError):
+        pass
+    else:
+        # Annotations can be changed or replaced after they're cached, comparing the snapshot catches both. Values are
+        # usually the same objects, so the comparison is mostly identity checks.
+        if raw_annotations == snapshot:
+            return dict(resolved)
+
     forward_reference_ns = ForwardReferencableNamespace(obj.__module__)
-    return {
+    annotations = {
         name: eval(anno, {}, forward_reference_ns) if isinstance(anno, str) else anno
-        for name, anno in obj.__annotations__.items()
+        for name, anno in raw_annotations.items()
     }
+    # Only cache once every name has been resolved, forward references could resolve differently on a later call
+    if not forward_reference_ns.created_forward_refs:
+        try:
+            _resolved_annotations_cache[obj] = (dict(raw_annotations), dict(annotations))
+        except TypeError:
+            pass
+
+    return annotations
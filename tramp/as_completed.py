@@ -1,5 +1,5 @@
-"""Tramp's AsCompleted is a simple wrapper around asyncio.as_completed that provides an async iterator that yields the
-result of each task as they complete. It can also be used as a standard iterator to access the next result future.
+"""Tramp's AsCompleted provides an async iterator that yields the result of each task as they complete. It can also be
+used as a standard iterator to access the next result future, the same way that asyncio.as_completed is used.
 
 Simple example:
 
@@ -9,19 +9,88 @@ And here's an example falling through to the as_completed iterator:
 
     for next_result in AsCompleted(*tasks):
         result = await next_result
+
+Each task gets a single done callback that pushes it onto a shared queue of completed tasks, so waiting on the next
+result never has to rescan the tasks that are still pending. Tasks that are already done when passed in are queued
+immediately and are handed back before anything that has to wait on the event loop.
+
+Coroutines can be passed in place of tasks. On Python 3.12+ passing eager=True starts them with
+asyncio.eager_task_factory, so coroutines that finish without suspending never touch the event loop's scheduler
+(see CPython gh-104144):
+
+    async for result in AsCompleted(*coroutines, eager=True):
 """
 import asyncio
+import contextvars
+from collections import deque
+from typing import Any, Awaitable, Coroutine, Iterator
+
+_HAS_EAGER_TASKS = hasattr(asyncio, "eager_task_factory")
 
 
 class AsCompleted:
-    """A simple wrapper around asyncio.as_completed that provides an async iterator that yields the result of each task
-    as they complete. It can also be used as a standard iterator to access the next result future."""
-    def __init__(self, *tasks: asyncio.Task):
-        self._tasks = asyncio.as_completed(tasks)
+    """Provides an async iterator that yields the result of each task as they complete. It can also be used as a
+    standard iterator to access the next result future."""
+    def __init__(self, *tasks: asyncio.Task | Coroutine, eager: bool = False):
+        self._done: deque[asyncio.Future] = deque()
+        self._waiters: list[asyncio.Future] = []
+        self._pending = 0
+        # _on_done doesn't read any context variables, so its callbacks share an empty context rather than copying the
+        # current context for every task. It's per instance because a context can only be entered by one thread at a
+        # time, and an instance's callbacks all run on its event loop.
+        self._context = contextvars.Context()
+        # Duplicates are only yielded once, matching asyncio.as_completed
+        futures = {}
+        for task in dict.fromkeys(tasks):
+            futures.setdefault(self._create_task(task, eager))
+
+        for task in futures:
+            if task.done():
+                self._done.append(task)
+            else:
+                self._pending += 1
+                task.add_done_callback(self._on_done, context=self._context)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._done:
+            return self._done.popleft().result()
+
+        if self._pending == 0:
+            raise StopAsyncIteration
+
+        return await self._next_result()
+
+    def __iter__(self) -> Iterator[Awaitable[Any]]:
+        for _ in range(len(self._done) + self._pending):
+            # Finished tasks can be awaited directly, they return their result without suspending
+            yield self._done.popleft() if self._done else self._next_result()
+
+    @staticmethod
+    def _create_task(task: asyncio.Task | Coroutine, eager: bool) -> asyncio.Future:
+        if eager and _HAS_EAGER_TASKS and asyncio.iscoroutine(task):
+            return asyncio.eager_task_factory(asyncio.get_running_loop(), task)
+
+        return asyncio.ensure_future(task)
+
+    async def _next_result(self) -> Any:
+        while not self._done:
+            # Another consumer may have taken the last result
+            if self._pending == 0:
+                raise StopAsyncIteration
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
 
-    async def __aiter__(self):
-        for next_result in self._tasks:
-            yield await next_result
+        return self._done.popleft().result()
 
-    def __iter__(self):
-        return iter(self._tasks)
+    def _on_done(self, task: asyncio.Future):
+        self._done.append(task)
+        self._pending -= 1
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
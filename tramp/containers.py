@@ -1,11 +1,16 @@
 from typing import overload, TypeVar, Generic
 
+from tramp.sentinels import sentinel
+
 T = TypeVar("T")
+_NOT_SET = sentinel("_NOT_SET")()
 
 
 class Container(Generic[T]):
     """Containers are used to provide a reference to a changeable value."""
 
+    __slots__ = ("_value",)
+
     @overload
     def __init__(self):
         ...
@@ -14,32 +19,22 @@ class Container(Generic[T]):
     def __init__(self, default: T):
         ...
 
-    def __init__(self, *args, **kwargs):
-        self._set, self._value = self._process_args(args, kwargs)
+    def __init__(self, default: T = _NOT_SET):
+        self._value = default
 
     @property
     def never_set(self) -> bool:
-        return self._set is False
+        return self._value is _NOT_SET
 
     @property
     def value(self):
-        if self.never_set:
+        if (value := self._value) is _NOT_SET:
             raise ValueError("No value has been set on the container.")
 
-        return self._value
+        return value
 
     def set(self, value: T):
         self._value = value
-        self._set = True
 
     def value_or(self, default: T) -> T:
-        return self._value if self._set else default
-
-    def _process_args(self, args, kwargs):
-        if len(args):
-            return True, args[0]
-
-        if "default" in kwargs:
-            return True, kwargs["default"]
-
-        return False, None
+        return default if (value := self._value) is _NOT_SET else value
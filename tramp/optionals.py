@@ -1,7 +1,5 @@
 from typing import Generic, NoReturn, TypeVar, Type
 
-from tramp.singleton import singleton
-
 T = TypeVar("T")
 V = TypeVar("V")
 
@@ -19,6 +17,8 @@ class OptionalHasNoValueException(OptionalException):
 
 
 class Optional(Generic[V]):
+    __slots__ = ()
+
     Some: "Type[Optional[V]]"
     Nothing: "Type[Optional[V]]"
 
@@ -44,10 +44,11 @@ class Optional(Generic[V]):
 
     @classmethod
     def wrap(cls, obj: T | None) -> "Optional[T]":
-        return cls.Nothing() if obj is None else cls.Some(obj)
+        return _NOTHING if obj is None else cls.Some(obj)
 
 
 class Some(Optional):
+    __slots__ = ("_value",)
     __match_args__ = ("value",)
 
     def __init__(self, value: V):
@@ -61,8 +62,12 @@ class Some(Optional):
         return True
 
 
-@singleton
 class Nothing(Optional):
+    __slots__ = ()
+
+    def __new__(cls, *_):
+        return _NOTHING
+
     @property
     def value(self) -> NoReturn:
         raise OptionalHasNoValueException("No value was set, this is Nothing")
@@ -71,5 +76,7 @@ class Nothing(Optional):
         return default
 
 
+_NOTHING = object.__new__(Nothing)
+
 Optional.Some = Some
 Optional.Nothing = Nothing
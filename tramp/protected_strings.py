@@ -1,57 +1,48 @@
-from mailbox import FormatError
-from typing import Callable, Iterable, overload, Protocol, runtime_checkable
+import sys
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, overload
 
 
-@runtime_checkable
-class CallableProtocol(Protocol):
-    def __call__(self, *args, **kwargs):
-        ...
-
-
-@runtime_checkable
-class ContainsProtocol(Protocol):
-    def __contains__(self, item) -> bool:
-        ...
+class FormatError(ValueError):
+    """Raised when a protected string format spec is invalid."""
 
 
 class ProtectedString:
+    __slots__ = ("value", "name", "hide_name")
+
     def __init__(self, value: str, name: str = "", *, hide_name: bool = False):
         self.value = value
-        self.name = name
+        # Names are compared against allowed names on every render, interning lets most comparisons match by identity
+        self.name = sys.intern(name) if type(name) is str else name
         self.hide_name = hide_name
 
     def __add__(self, other) -> "ProtectedStringBuilder":
-        match other:
-            case ProtectedString() | str():
-                return ProtectedStringBuilder(self, other)
+        if isinstance(other, (ProtectedString, str)):
+            return ProtectedStringBuilder._from_list([self, other], True)
 
-            case _:
-                return NotImplemented
+        return NotImplemented
 
     def __radd__(self, other) -> "ProtectedStringBuilder":
-        match other:
-            case ProtectedString() | str():
-                return ProtectedStringBuilder(other, self)
+        if isinstance(other, (ProtectedString, str)):
+            return ProtectedStringBuilder._from_list([other, self], True)
 
-            case _:
-                return NotImplemented
+        return NotImplemented
 
     def __iadd__(self, other) -> "ProtectedStringBuilder":
-        match other:
-            case ProtectedString() | str():
-                return self + other
+        if isinstance(other, (ProtectedString, str)):
+            return self + other
 
-            case _:
-                return NotImplemented
+        return NotImplemented
 
     def __format__(self, format_spec):
-        return format(ProtectedStringBuilder(self), format_spec)
+        redact_with, allowed = _parse_format_spec(format_spec)
+        if allowed is not None and self.name in allowed:
+            return self.value
 
-    def __repr__(self):
-        if self.name and not self.hide_name:
-            return f"<Redacted {self.name.title()}>"
+        return repr(self) if redact_with is None else redact_with
 
-        return f"<Redacted>"
+    def __repr__(self):
+        return _redacted_repr(self.name, self.hide_name)
 
     @classmethod
     def join(
@@ -61,13 +52,23 @@ class ProtectedString:
         *,
         allowed: "Callable[[ProtectedString], bool] | Iterable[str] | None" = None
     ) -> str:
-        builder = ProtectedStringBuilder(*parts)
-        return builder.render(redact_with, allowed=allowed)
+        return _render(parts, redact_with, allowed)
 
 
 class ProtectedStringBuilder:
+    __slots__ = ("strings", "_has_protected")
+
     def __init__(self, *strings: str | ProtectedString):
         self.strings = list(strings)
+        self._has_protected = any(isinstance(string, ProtectedString) for string in strings)
+
+    @classmethod
+    def _from_list(cls, strings: "list[str | ProtectedString]", has_protected: bool) -> "ProtectedStringBuilder":
+        """Creates a builder that takes ownership of the list rather than copying it."""
+        builder = cls.__new__(cls)
+        builder.strings = strings
+        builder._has_protected = has_protected
+        return builder
 
     @overload
     def add(self, string: str | ProtectedString):
@@ -82,6 +83,7 @@ class ProtectedStringBuilder:
             string = ProtectedString(string, name, hide_name=hide_name)
 
         self.strings.append(string)
+        self._has_protected = self._has_protected or isinstance(string, ProtectedString)
 
     def render(
         self,
@@ -89,62 +91,136 @@ class ProtectedStringBuilder:
         *,
         allowed: Callable[[ProtectedString], bool] | Iterable[str] | None = None
     ) -> str:
-        return "".join(
-            self._redact(value, redact_with, allowed) if isinstance(value, ProtectedString) else value
-            for value in self.strings
-        )
-
-    def _redact(
-        self,
-        string: ProtectedString,
-        redact_with: str | None,
-        allowed: Callable[[ProtectedString], bool] | Iterable[str] | None) -> str:
-        match allowed:
-            case CallableProtocol() if allowed(string):
-                return string.value
-
-            case ContainsProtocol() if string.name in allowed:
-                return string.value
-
-            case _:
-                return repr(string) if redact_with is None else redact_with
+        """Renders the strings, redacting protected strings unless they're allowed. Allowed can be a predicate or a
+        collection of names, names given as a list or other iterable are converted to a frozenset so each lookup is
+        constant time."""
+        if not self._has_protected:
+            # Protected strings added directly to the strings list make join raise a TypeError rather than leak
+            try:
+                return "".join(self.strings)
+            except TypeError:
+                pass
+
+        return _render(self.strings, redact_with, allowed)
 
     def __add__(self, other):
-        match other:
-            case ProtectedString() | str():
-                self.add(other)
-                return self
+        if isinstance(other, ProtectedStringBuilder):
+            return ProtectedStringBuilder._from_list(
+                self.strings + other.strings, self._has_protected or other._has_protected
+            )
 
-            case ProtectedStringBuilder():
-                self.strings.extend(other.strings)
-                return self
+        if isinstance(other, (ProtectedString, str)):
+            strings = self.strings.copy()
+            strings.append(other)
+            return ProtectedStringBuilder._from_list(
+                strings, self._has_protected or isinstance(other, ProtectedString)
+            )
 
-            case _:
-                return NotImplemented
+        return NotImplemented
 
     def __radd__(self, other):
-        match other:
-            case ProtectedString() | str():
-                return ProtectedStringBuilder(other, *self.strings)
+        if isinstance(other, (ProtectedString, str)):
+            return ProtectedStringBuilder._from_list(
+                [other, *self.strings], self._has_protected or isinstance(other, ProtectedString)
+            )
 
-            case _:
-                return NotImplemented
+        return NotImplemented
 
     def __iadd__(self, other):
-        return self + other
+        if isinstance(other, ProtectedStringBuilder):
+            self.strings.extend(other.strings)
+            self._has_protected = self._has_protected or other._has_protected
+            return self
 
-    def __format__(self, format_spec):
-        redact_with, sep, allowed_names = format_spec.partition("$")
-        allowed = lambda _: False
-
-        if sep and not allowed_names:
-            raise FormatError("No allowed names provided.")
+        if isinstance(other, (ProtectedString, str)):
+            self.strings.append(other)
+            self._has_protected = self._has_protected or isinstance(other, ProtectedString)
+            return self
 
-        filtered_names = set(name for name in allowed_names.split(",") if name.strip())
-        if not all(name.isidentifier() for name in filtered_names):
-            raise FormatError("Allowed names provided.")
+        return NotImplemented
 
-        if allowed_names:
-            allowed = lambda s: s.name in filtered_names
-
-        return self.render(redact_with or None, allowed=allowed)
+    def __format__(self, format_spec):
+        redact_with, allowed = _parse_format_spec(format_spec)
+        return self.render(redact_with, allowed=allowed)
+
+
+def _render(
+    strings: "Iterable[str | ProtectedString]",
+    redact_with: str | None,
+    allowed: Callable[[ProtectedString], bool] | Iterable[str] | None
+) -> str:
+    # Locals avoid global lookups for every string
+    protected_string = ProtectedString
+    if allowed is None:
+        # Nothing can be allowed, the most common case, so skip the predicate entirely
+        if redact_with is None:
+            return "".join([repr(value) if isinstance(value, protected_string) else value for value in strings])
+
+        return "".join([redact_with if isinstance(value, protected_string) else value for value in strings])
+
+    is_allowed = _get_allowed_check(allowed)
+    parts = []
+    append = parts.append
+    for value in strings:
+        if not isinstance(value, protected_string):
+            append(value)
+        elif is_allowed(value):
+            append(value.value)
+        elif redact_with is None:
+            append(repr(value))
+        else:
+            append(redact_with)
+
+    return "".join(parts)
+
+
+def _get_allowed_check(
+    allowed: Callable[[ProtectedString], bool] | Iterable[str] | None
+) -> Callable[[ProtectedString], bool]:
+    """Resolves the allowed argument into a predicate once per render rather than once per protected string."""
+    if callable(allowed):
+        return allowed
+
+    if not isinstance(allowed, (set, frozenset, str)) and hasattr(allowed, "__iter__"):
+        allowed = frozenset(allowed)
+
+    if hasattr(allowed, "__contains__"):
+        return lambda string: string.name in allowed
+
+    return lambda _: False
+
+
+@lru_cache(maxsize=256)
+def _redacted_repr(name: str, hide_name: bool) -> str:
+    """Builds the redacted repr for a protected string. The same names are rendered over and over, so the results are
+    cached by name rather than on each instance, which keeps them correct if a protected string's name is changed."""
+    if name and not hide_name:
+        return f"<Redacted {name.title()}>"
+
+    return f"<Redacted>"
+
+
+@lru_cache(maxsize=256)
+def _parse_format_spec(format_spec: str) -> tuple[str | None, frozenset[str] | None]:
+    """Parses a format spec of the form "redact_with$name1,name2" into the redaction string and the set of allowed
+    names. Format specs are usually reused across many format calls, so the parsed results are cached."""
+    redact_with, sep, allowed_names = format_spec.partition("$")
+    if not sep:
+        return redact_with or None, None
+
+    if not allowed_names:
+        raise FormatError("No allowed names provided.")
+
+    filtered_names = frozenset(_iter_names(allowed_names))
+    if not all(map(str.isidentifier, filtered_names)):
+        raise FormatError("Allowed names provided.")
+
+    return redact_with or None, filtered_names
+
+
+def _iter_names(names: str) -> Iterator[str]:
+    """Yields each non-empty, stripped name from a comma separated string without building a list of substrings."""
+    while names:
+        name, _, names = names.partition(",")
+        if name := name.strip():
+            yield sys.intern(name)
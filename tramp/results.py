@@ -1,6 +1,9 @@
-from typing import Generic, NoReturn, TypeVar, Type
+from typing import Any, Callable, Generic, NoReturn, TypeVar, Type
+
+from tramp.sentinels import sentinel
 
 V = TypeVar("V")
+_NOT_SET = sentinel("_NOT_SET")()
 
 
 class ResultException(Exception):
@@ -20,18 +23,13 @@ class ResultWasNeverSetException(ResultException):
 
 
 class _ResultBuilder(Generic[V]):
+    # Must match the slots on Result so that __exit__ can swap the builder's class to Value or Error
+    __slots__ = ("value", "_error")
+
     def __init__(self):
-        self._value = None
+        self.value = _NOT_SET
         self._error = None
 
-    @property
-    def value(self) -> V:
-        return self._value
-
-    @value.setter
-    def value(self, value: V):
-        self._value = value
-
     @property
     def error(self) -> Exception:
         return self._error
@@ -45,7 +43,7 @@ class _ResultBuilder(Generic[V]):
             self.__init__(exc_val)
             return True
 
-        if self._value is None and self._error is None:
+        if self.value is _NOT_SET:
             with _ResultBuilder() as r:
                 raise ResultWasNeverSetException("No result was ever set.")
 
@@ -57,6 +55,9 @@ class _ResultBuilder(Generic[V]):
 
 
 class Result(Generic[V]):
+    # Value reads value straight from its slot, Error shadows the slot with a property that raises
+    __slots__ = ("value", "_error")
+
     Value: "Type[Value[V]]"
     Error: "Type[Error[V]]"
 
@@ -71,10 +72,6 @@ class Result(Generic[V]):
     def __bool__(self):
         return False
 
-    @property
-    def value(self) -> V | NoReturn:
-        raise RuntimeError
-
     @property
     def error(self) -> Exception | None:
         return
@@ -86,25 +83,34 @@ class Result(Generic[V]):
     def build(cls) -> _ResultBuilder[V]:
         return _ResultBuilder()
 
+    @classmethod
+    def try_(cls, func: Callable[..., V], *args: Any, **kwargs: Any) -> "Result[V]":
+        """Calls the function with the given arguments, returning its return value wrapped in a Value or any exception
+        it raises wrapped in an Error."""
+        try:
+            return cls.Value(func(*args, **kwargs))
+        except Exception as e:
+            return cls.Error(e)
+
 
 class Value(Result[V]):
+    __slots__ = ()
     __match_args__ = ("value",)
 
+    value: V
+
     def __init__(self, value: V):
-        self._value = value
+        self.value = value
 
     def __repr__(self):
-        return f"{Result.__name__}.{type(self).__name__}({self._value!r})"
+        return f"{Result.__name__}.{type(self).__name__}({self.value!r})"
 
     def __bool__(self):
         return True
 
-    @property
-    def value(self) -> V:
-        return self._value
-
 
 class Error(Result[V]):
+    __slots__ = ()
     __match_args__ = ("error",)
 
     def __init__(self, error: Exception):
@@ -1,22 +1,49 @@
+import sys
 from typing import Type, cast
 
 
 class SentinelMCS(type):
+    def __call__(cls):
+        # Fast path that skips __new__ once the instance exists. It's looked up on the class's own __dict__ so
+        # subclasses of a sentinel get their own instance.
+        inst = cls.__dict__.get("__sentinel_instance__")
+        return super().__call__() if inst is None else inst
+
     def __repr__(self):
         return f"<sentinel class '{self.__name__}'>"
 
 
 class Sentinel(metaclass=SentinelMCS):
+    __slots__ = ()
+
+    # Sentinels are singletons, so equality and hashing are always identity based
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
     def __new__(cls):
-        inst = super().__new__(cls)
-        cls.__new__ = lambda _: inst
+        # copy and pickle create instances through __new__ directly, so it must also hand back the singleton
+        inst = cls.__dict__.get("__sentinel_instance__")
+        if inst is None:
+            inst = super().__new__(cls)
+            cls.__sentinel_instance__ = inst
+
         return inst
 
     def __repr__(self):
         return f"<Sentinel:{type(self).__qualname__}>"
 
+    def __reduce__(self):
+        # Pickle by reference so unpickling returns the singleton. Modules can store either the sentinel instance or
+        # its type under the sentinel's name.
+        cls = type(self)
+        if getattr(sys.modules.get(cls.__module__), cls.__qualname__, None) is self:
+            return cls.__qualname__
+
+        return cls, ()
+
 
 def sentinel(name: str) -> Type[Sentinel]:
     """Create a new sentinel type."""
-
-    return cast(Type[Sentinel], SentinelMCS(name, (Sentinel,), {}))
+    # Attribute the type to the calling module, like namedtuple, so that it can be pickled by reference
+    module = sys._getframe(1).f_globals.get("__name__", __name__)
+    return cast(Type[Sentinel], SentinelMCS(name, (Sentinel,), {"__slots__": (), "__module__": module}))